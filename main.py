@@ -8,6 +8,7 @@ from src.ai_curator import NewsCurator
 from src.pdf_generator import NewsFormatter
 from src.epub_generator import EpubGenerator
 from src.emailer import EmailSender
+from src.delivery_optimizer import DeliveryOptimizer
 
 load_dotenv()
 
@@ -21,10 +22,11 @@ def main():
     sources = config['sources']
     
     # Instancia as ferramentas
+    optimizer = DeliveryOptimizer(config.get('delivery'))
     scraper = NewsScraper()
-    curator = NewsCurator()
+    curator = NewsCurator(stream=config.get('api', {}).get('stream', False))
     formatter = NewsFormatter()
-    epub_gen = EpubGenerator()
+    epub_gen = EpubGenerator(optimizer=optimizer)
     emailer = EmailSender()
 
     # --- ETAPA A: Coleta (O scraper agora imprime o próprio registro) ---
@@ -75,20 +77,35 @@ def main():
         output_filename=f"Jornal_{date_str}.pdf"
     )
 
-    # Atualiza a chamada do EPUB (vamos alterar a classe abaixo)
-    epub_path = epub_gen.create_epub(
-        briefing, 
-        processed_articles, 
-        unselected_list=unselected, 
-        output_filename=f"Jornal_{date_str}.epub"
+    # O EPUB é o arquivo enviado: se passar do limite de anexo, é dividido em volumes.
+    # 'Outras Manchetes' vai apenas no último volume.
+    def volume_name(number, total):
+        suffix = f"_vol{number}" if total > 1 else ""
+        return f"Jornal_{date_str}{suffix}.epub"
+
+    def volume_label(number, total):
+        return f"Volume {number} de {total}" if total > 1 else None
+
+    print(f"\nTamanho do EPUB gerado:")
+    epub_paths, oversized = optimizer.build_volumes(
+        processed_articles,
+        lambda chunk, number, total: epub_gen.create_epub(
+            briefing,
+            chunk,
+            unselected_list=unselected if number == total else None,
+            output_filename=volume_name(number, total),
+            volume_label=volume_label(number, total)
+        )
     )
+    for path in oversized:
+        print(f"   Não enviado (acima do limite): {path}")
 
-    if epub_path:
+    if epub_paths:
         target = os.getenv("KINDLE_EMAIL")
         print(f"Enviando para Kindle: {target}...")
-        sent = emailer.send_pdf(epub_path, target_email=target)
+        sent = all([emailer.send_pdf(path, target_email=target) for path in epub_paths])
         
-        if sent:
+        if sent and not oversized:
             print(f"\nSUCESSO! Edição concluída e enviada.")
 
 if __name__ == "__main__":
@@ -1,12 +1,13 @@
 import os
 import json
+import time
 from google import genai
 from dotenv import load_dotenv
 
 load_dotenv()
 
 class NewsCurator:
-    def __init__(self):
+    def __init__(self, stream=False):
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise ValueError("Erro: GEMINI_API_KEY não encontrada no .env")
@@ -14,6 +15,10 @@ class NewsCurator:
         self.client = genai.Client(api_key=api_key)
         self.model_name = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
 
+        # Modo streaming: o texto chega em pedaços e os tempos de cada chamada
+        # são exibidos (TTFT = primeiro token, TTLT = último token)
+        self.stream = stream
+
     def filter_candidates(self, candidates_list, topics, limit=7):
         """
         Analisa as notícias baseada em uma lista de tópicos (strings).
@@ -56,6 +61,31 @@ class NewsCurator:
             print(f"Erro na filtragem: {e}")
             return candidates_list[:limit]
 
+    def _generate_text(self, prompt, label=""):
+        """
+        Gera o texto da resposta. Em modo streaming, exibe o tempo até o
+        primeiro e até o último token da chamada.
+        """
+        if not self.stream:
+            response = self.client.models.generate_content(model=self.model_name, contents=prompt)
+            return response.text
+
+        start = time.perf_counter()
+        ttft = None
+        parts = []
+        for chunk in self.client.models.generate_content_stream(model=self.model_name, contents=prompt):
+            text = chunk.text
+            if not text:
+                continue
+            if ttft is None:
+                ttft = time.perf_counter() - start
+            parts.append(text)
+        ttlt = time.perf_counter() - start
+
+        ttft_str = f"{ttft:.2f}s" if ttft is not None else "-"
+        print(f"      [Streaming] {label[:40]} | TTFT: {ttft_str} | TTLT: {ttlt:.2f}s")
+        return "".join(parts)
+
     def summarize_article(self, article_data):
         # Mantemos igual, pois o resumo depende mais do conteúdo da notícia
         print(f"Resumindo: {article_data['title']}...")
@@ -75,8 +105,7 @@ class NewsCurator:
         - Tom profissional e direto. Sem saudações.
         """
         try:
-            response = self.client.models.generate_content(model=self.model_name, contents=prompt)
-            return response.text
+            return self._generate_text(prompt, label=article_data['title'])
         except Exception as e:
             return f"## {article_data['title']}\n\nErro ao gerar resumo: {e}"
 
@@ -102,8 +131,7 @@ class NewsCurator:
         Seja conciso.
         """
         try:
-            response = self.client.models.generate_content(model=self.model_name, contents=prompt)
-            return response.text
+            return self._generate_text(prompt, label="Briefing")
         except:
             return "# Briefing\nErro ao gerar briefing."
 
@@ -0,0 +1,120 @@
+import os
+import math
+import zipfile
+import tempfile
+
+class DeliveryOptimizer:
+    """
+    Reduz o tamanho dos arquivos gerados (EPUB/PDF) antes do envio por e-mail
+    e verifica se o anexo cabe no limite configurado.
+    """
+    # O anexo vai em base64 no e-mail: cada 3 bytes viram 4 (+ quebras de linha a cada 76 chars)
+    BASE64_OVERHEAD = (4 / 3) * (78 / 76)
+
+    def __init__(self, settings=None):
+        settings = settings or {}
+        self.max_attachment_bytes = int(float(settings.get('max_attachment_mb', 25)) * 1024 * 1024)
+        self.zip_compresslevel = int(settings.get('zip_compresslevel', 9))
+
+    # --- EPUB ---
+
+    def optimize_epub(self, epub_path):
+        """
+        Reempacota o EPUB com compressão máxima, mantendo o 'mimetype'
+        como primeira entrada e sem compressão (exigência da especificação).
+        """
+        fd, tmp_path = tempfile.mkstemp(suffix=".epub", dir=os.path.dirname(epub_path) or ".")
+        os.close(fd)
+        try:
+            with zipfile.ZipFile(epub_path, 'r') as src, \
+                 zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=self.zip_compresslevel) as dst:
+                names = src.namelist()
+                if 'mimetype' in names:
+                    dst.writestr(zipfile.ZipInfo('mimetype'), src.read('mimetype'), compress_type=zipfile.ZIP_STORED)
+
+                for name in names:
+                    if name != 'mimetype':
+                        dst.writestr(name, src.read(name))
+
+            before = os.path.getsize(epub_path)
+            after = os.path.getsize(tmp_path)
+            if after < before:
+                os.replace(tmp_path, epub_path)
+            else:
+                os.remove(tmp_path)
+        except Exception as e:
+            print(f"Aviso: falha ao recomprimir EPUB ({e}).")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return epub_path
+
+    # --- Tamanho / Limite ---
+
+    def encoded_size(self, file_path):
+        """Tamanho aproximado do anexo depois da codificação base64."""
+        return int(os.path.getsize(file_path) * self.BASE64_OVERHEAD)
+
+    def fits(self, file_path):
+        return self.encoded_size(file_path) <= self.max_attachment_bytes
+
+    def report(self, file_path):
+        """Imprime o tamanho final frente ao limite e retorna True se couber."""
+        raw_mb = os.path.getsize(file_path) / (1024 * 1024)
+        encoded_mb = self.encoded_size(file_path) / (1024 * 1024)
+        limit_mb = self.max_attachment_bytes / (1024 * 1024)
+        ok = self.fits(file_path)
+        status = "OK" if ok else "EXCEDE O LIMITE"
+        print(f"   {os.path.basename(file_path)}: {raw_mb:.2f} MB "
+              f"(~{encoded_mb:.2f} MB no e-mail / limite {limit_mb:.0f} MB) [{status}]")
+        return ok
+
+    def build_volumes(self, articles_list, build_fn):
+        """
+        Gera a edição e, se o arquivo passar do limite, divide os artigos em volumes.
+        O número de volumes é estimado pelo tamanho medido (tamanho / limite), então
+        normalmente basta uma nova geração.
+
+        build_fn(articles_chunk, volume_number, total_volumes) deve gerar o arquivo
+        e retornar seu caminho. Em caso de erro deve lançar exceção, para que nenhum
+        volume seja perdido silenciosamente.
+
+        Retorna (caminhos_que_cabem, caminhos_acima_do_limite). Os arquivos acima do
+        limite (ex.: um único artigo já maior que o limite) não devem ser enviados.
+        """
+        max_volumes = max(1, len(articles_list))
+        total = 1
+
+        while True:
+            chunks = self._split(articles_list, total)
+            paths = []
+            for number, chunk in enumerate(chunks, start=1):
+                paths.append(build_fn(chunk, number, len(chunks)))
+
+            oversized = [p for p in paths if not self.report(p)]
+            if not oversized or total >= max_volumes:
+                break
+
+            # Estima quantos volumes são necessários a partir do tamanho total gerado
+            total_size = sum(self.encoded_size(p) for p in paths)
+            needed = math.ceil(total_size / float(self.max_attachment_bytes))
+            total = min(max_volumes, max(total + 1, needed))
+            print(f"Edição acima do limite de anexo. Dividindo em {total} volumes...")
+            for p in paths:
+                os.remove(p)
+
+        if oversized:
+            print(f"Aviso: {len(oversized)} arquivo(s) continuam acima do limite e não serão enviados.")
+        fitting = [p for p in paths if p not in oversized]
+        return fitting, oversized
+
+    def _split(self, items, parts):
+        """Divide a lista em 'parts' pedaços contíguos de tamanho equilibrado."""
+        if parts <= 1 or not items:
+            return [items]
+        size, extra = divmod(len(items), parts)
+        chunks, start = [], 0
+        for i in range(parts):
+            end = start + size + (1 if i < extra else 0)
+            chunks.append(items[start:end])
+            start = end
+        return chunks
@@ -4,7 +4,9 @@ from ebooklib import epub
 from datetime import datetime
 
 class EpubGenerator:
-    def __init__(self):
+    def __init__(self, optimizer=None):
+        # Otimizador de tamanho (opcional): recomprime o arquivo final
+        self.optimizer = optimizer
         self.css_style = '''
             body { font-family: "Bookerly", "Charis SIL", serif; margin: 5%; }
             h1 { text-align: center; color: #2C3E50; margin-bottom: 0.5em; }
@@ -17,11 +19,12 @@ class EpubGenerator:
             img { max-width: 100%; height: auto; display: block; margin: 1em auto; }
         '''
 
-    def create_epub(self, briefing_text, articles_list, unselected_list=None, output_filename="daily_briefing.epub"):
+    def create_epub(self, briefing_text, articles_list, unselected_list=None, output_filename="daily_briefing.epub", volume_label=None):
         # 1. Configuração Básica do Livro
         book = epub.EpubBook()
         book.set_identifier(str(uuid.uuid4()))
-        book.set_title(f"Jornal Karteiro - {datetime.now().strftime('%d/%m/%Y')}")
+        title_suffix = f" ({volume_label})" if volume_label else ""
+        book.set_title(f"Jornal Karteiro - {datetime.now().strftime('%d/%m/%Y')}{title_suffix}")
         book.set_language('pt-br')
         book.add_author('Github: diegusxavier')
 
@@ -68,7 +71,7 @@ class EpubGenerator:
                     print(f"Erro ao anexar imagem EPUB: {e}")
 
             # Conteúdo (Resumo da IA)
-            content_body = self._markdown_to_html(art.get('ai_summary', ''))
+            content_body = self.render_article_body(art)
 
             # Monta o HTML do capítulo
             html_content = f"""
@@ -123,9 +126,15 @@ class EpubGenerator:
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
         epub.write_epub(output_path, book, {})
+        if self.optimizer:
+            self.optimizer.optimize_epub(output_path)
         print(f"EPUB gerado com sucesso em: {output_path}")
         return output_path
 
+    def render_article_body(self, article):
+        """HTML do corpo do capítulo (resumo da IA) de um artigo."""
+        return self._markdown_to_html(article.get('ai_summary', ''))
+
     def _markdown_to_html(self, text):
         """Conversor simples de MD para HTML para manter dependências leves"""
         html = text.replace('\n', '<br/>')
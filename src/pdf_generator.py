@@ -116,6 +116,49 @@ class NewsFormatter:
             else: flowables.append(Paragraph(line, self.styles['BodyTextCustom']))
         return flowables
 
+    def build_article_section(self, article):
+        """
+        Monta os flowables da seção de um artigo (bookmark, título, metadados, imagem, resumo).
+        """
+        section = []
+        clean_title = escape(article['title'])
+        
+        # Bookmark na barra lateral
+        section.append(Bookmark(clean_title, level=0))
+        
+        # Título com âncora (destino do link) e link externo (fonte)
+        if article.get('url'):
+            title_html = f'<a name="{article["internal_id"]}"/><a href="{article["url"]}" color="darkred">{clean_title}</a>'
+        else:
+            title_html = f'<a name="{article["internal_id"]}"/>{clean_title}'
+        
+        section.append(Paragraph(title_html, self.styles['ArticleTitle']))
+        
+        # Metadados
+        source_info = f"Fonte: {article.get('source', 'Desconhecida')} | {article.get('published_at', '')}"
+        section.append(Paragraph(source_info, self.styles['Metadata']))
+        
+        # Imagem
+        if article.get('local_image_path') and os.path.exists(article['local_image_path']):
+            try:
+                img = Image(article['local_image_path'])
+                available_width = 380 
+                aspect = img.imageHeight / float(img.imageWidth)
+                img.drawWidth = available_width
+                img.drawHeight = available_width * aspect
+                section.append(img)
+                section.append(Spacer(1, 15))
+            except: pass
+
+        # Conteúdo
+        if 'ai_summary' in article:
+            section.extend(self._parse_markdown_to_flowables(article['ai_summary']))
+        
+        # Rodapé visual
+        section.append(Spacer(1, 25))
+        section.append(Paragraph("_" * 30, self.styles['BodyTextCustom']))
+        return section
+
     def create_pdf(self, briefing_text, articles_list, candidates_list=None, output_filename="daily_briefing.pdf"):
         output_path = os.path.join("data", "output", "pdfs", output_filename)
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
@@ -155,42 +198,7 @@ class NewsFormatter:
             if i > 0:
                 story.append(PageBreak())
 
-            clean_title = escape(article['title'])
-            
-            # Bookmark na barra lateral
-            story.append(Bookmark(clean_title, level=0))
-            
-            # Título com âncora (destino do link) e link externo (fonte)
-            if article.get('url'):
-                title_html = f'<a name="{article["internal_id"]}"/><a href="{article["url"]}" color="darkred">{clean_title}</a>'
-            else:
-                title_html = f'<a name="{article["internal_id"]}"/>{clean_title}'
-            
-            story.append(Paragraph(title_html, self.styles['ArticleTitle']))
-            
-            # Metadados
-            source_info = f"Fonte: {article.get('source', 'Desconhecida')} | {article.get('published_at', '')}"
-            story.append(Paragraph(source_info, self.styles['Metadata']))
-            
-            # Imagem
-            if article.get('local_image_path') and os.path.exists(article['local_image_path']):
-                try:
-                    img = Image(article['local_image_path'])
-                    available_width = 380 
-                    aspect = img.imageHeight / float(img.imageWidth)
-                    img.drawWidth = available_width
-                    img.drawHeight = available_width * aspect
-                    story.append(img)
-                    story.append(Spacer(1, 15))
-                except: pass
-
-            # Conteúdo
-            if 'ai_summary' in article:
-                story.extend(self._parse_markdown_to_flowables(article['ai_summary']))
-            
-            # Rodapé visual
-            story.append(Spacer(1, 25))
-            story.append(Paragraph("_" * 30, self.styles['BodyTextCustom']))
+            story.extend(self.build_article_section(article))
 
         # --- 4. Lista de Candidatos ---
         if candidates_list: